@@ -13,6 +13,10 @@ export default function RootLayout({
 }>) {
   return (
     <html lang="en">
+      <head>
+        <link rel="preconnect" href="https://api.crossref.org" crossOrigin="anonymous" />
+        <link rel="preconnect" href="https://api.openalex.org" crossOrigin="anonymous" />
+      </head>
       <body>{children}</body>
     </html>
   );
@@ -1,7 +1,7 @@
 
 "use client";
 
-import { ChangeEvent, DragEvent, useEffect, useMemo, useRef, useState } from "react";
+import { ChangeEvent, CSSProperties, DragEvent, useEffect, useMemo, useRef, useState } from "react";
 import * as pdfjsLib from "pdfjs-dist";
 
 type CrossrefAuthor = {
@@ -18,9 +18,27 @@ type CrossrefWork = {
   DOI?: string;
 };
 
+type OpenAlexWork = {
+  title?: string | null;
+  publication_year?: number | null;
+  authorships?: { author?: { display_name?: string | null } }[];
+  primary_location?: { source?: { display_name?: string | null } | null } | null;
+  doi?: string | null;
+};
+
+type MetadataCacheEntry = {
+  work: Promise<CrossrefWork>;
+  expiresAt: number;
+};
+
+type MetadataMissEntry = {
+  error: unknown;
+  expiresAt: number;
+};
+
 type Lang = "en" | "zh";
 
-type JobStatus = "queued" | "extracting" | "detecting" | "fetching" | "ready" | "failed";
+type JobStatus = "queued" | "extracting" | "fetching" | "ready" | "failed";
 
 type PdfJob = {
   id: string;
@@ -56,9 +74,9 @@ const TEXT = {
     manualPlaceholder: "Enter DOI manually",
     invalidDoi: "Invalid DOI",
     noDoiFound: "No DOI found",
+    invalidPdf: "Not a valid PDF file",
     statusQueued: "Queued",
     statusExtracting: "Extracting",
-    statusDetecting: "Detecting",
     statusFetching: "Fetching",
     statusReady: "Ready",
     statusFailed: "Failed",
@@ -84,38 +102,72 @@ const TEXT = {
     manualPlaceholder: "手動輸入 DOI",
     invalidDoi: "無效 DOI",
     noDoiFound: "找不到 DOI",
+    invalidPdf: "不是有效的 PDF 檔案",
     statusQueued: "排隊中",
     statusExtracting: "擷取中",
-    statusDetecting: "偵測中",
     statusFetching: "查詢中",
     statusReady: "完成",
     statusFailed: "失敗",
   },
 } satisfies Record<Lang, Record<string, string>>;
 
-const DOI_REGEX = /10\.\d{4,9}\/[\w.()/:;-]+/gi;
+// The last character class keeps trailing ")", ".", "," and ";" out of the match.
+const DOI_REGEX = /10\.\d{4,9}\/[\w.()/:;-]*[\w(/:-]/gi;
+const XMP_DOI_FIELD_REGEX =
+  /<(prism:doi|pdfx:doi|crossmark:DOI|dc:identifier)\b[^>]*>([\s\S]{0,512}?)<\/\1>|\b(?:prism:doi|pdfx:doi|crossmark:DOI)\s*=\s*"([^"]{0,256})"/gi;
+const INFO_DOI_FIELD_REGEX = /\/(?:doi|Subject)\s*\(((?:\\[\s\S]|[^\\)]){0,512})\)/gi;
+const PDF_STRING_ESCAPE_REGEX = /\\([()\\])/g;
+const STARTXREF_REGEX = /startxref\s+(\d+)/g;
+const TRAILER_INFO_REGEX = /\/Info\s+(\d+)\s+\d+\s+R/g;
+const XREF_SECTION_HEADER_REGEX = /^xref\s+(\d+)\s+(\d+)[ \t]*(?:\r\n|\r|\n)/;
+const XREF_ENTRY_REGEX = /^(\d{10}) \d{5} n/;
+const DOI_URL_PREFIX_REGEX = /^https?:\/\/(dx\.)?doi\.org\//i;
+const DOI_NOISE_REGEX = /[\s<>"']+/g;
+const DOI_TRAILING_PUNCTUATION_REGEX = /[).,;]+$/;
+const UNSAFE_FILENAME_CHARS_REGEX = /[\u0000-\u001f\u007f\\/:*?"<>|]/g;
+const WHITESPACE_REGEX = /\s+/g;
 const MAX_FILENAME_LENGTH = 180;
 const MAX_SHORT_TITLE_LENGTH = 60;
 const MAX_JOURNAL_ABBR_LENGTH = 40;
+const MAX_TEXT_PAGES = 2;
+const PDF_HEADER_SCAN_BYTES = 1024;
+const RAW_DOI_SCAN_BYTES = 512 * 1024;
+const PDF_TRAILER_SCAN_BYTES = 1024;
+const PDF_OBJECT_SCAN_BYTES = 4 * 1024;
+const XREF_ENTRY_BYTES = 20;
+const MAX_FETCH_ATTEMPTS = 3;
+const RETRY_BASE_DELAY_MS = 600;
+const MAX_RETRY_DELAY_MS = 10_000;
+const RETRYABLE_STATUSES = new Set([408, 429, 500, 502, 503, 504, 522, 524]);
+const METADATA_CACHE_SIZE = 256;
+const METADATA_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
+const METADATA_MISS_CACHE_SIZE = 128;
+const METADATA_MISS_CACHE_TTL_MS = 60 * 1000;
 const JOURNAL_STOP_WORDS = new Set(["of", "and", "the", "in"]);
 
+const TABLE_HEADER_STYLE: CSSProperties = {
+  textAlign: "left",
+  borderBottom: "1px solid #e5e7eb",
+  padding: "8px 6px",
+};
+const TABLE_CELL_STYLE: CSSProperties = { verticalAlign: "top", padding: "8px 6px" };
+const DOI_CELL_STYLE: CSSProperties = { ...TABLE_CELL_STYLE, minWidth: 220 };
+
 if (typeof window !== "undefined") {
   pdfjsLib.GlobalWorkerOptions.workerSrc = `https://unpkg.com/pdfjs-dist@${pdfjsLib.version}/build/pdf.worker.min.mjs`;
 }
 
 const cleanDoi = (value: string): string =>
   value
-    .replace(/^https?:\/\/(dx\.)?doi\.org\//i, "")
-    .replace(/\s+/g, "")
-    .replace(/[<>"']/g, "")
-    .replace(/[).,;]+$/, "");
+    .replace(DOI_URL_PREFIX_REGEX, "")
+    .replace(DOI_NOISE_REGEX, "")
+    .replace(DOI_TRAILING_PUNCTUATION_REGEX, "");
 
 const sanitizeFilename = (value: string): string =>
   value
     .normalize("NFKD")
-    .replace(/[\u0000-\u001f\u007f]/g, "")
-    .replace(/[\\/:*?"<>|]/g, "")
-    .replace(/\s+/g, " ")
+    .replace(UNSAFE_FILENAME_CHARS_REGEX, "")
+    .replace(WHITESPACE_REGEX, " ")
     .trim();
 
 const truncate = (value: string, maxLength: number): string =>
@@ -126,26 +178,113 @@ const safeSegment = (value: string, fallback: string): string => {
   return cleaned.length > 0 ? cleaned : fallback;
 };
 
-async function extractTextFromPdf(file: File): Promise<string> {
+const findDois = (text: string): string[] => {
+  const matches = text.match(DOI_REGEX) ?? [];
+  return [...new Set(matches)];
+};
+
+const readLatin1 = async (blob: Blob): Promise<string> =>
+  new TextDecoder("latin1").decode(await blob.arrayBuffer());
+
+// Readers accept "%PDF-" anywhere in the first 1KB, so junk before the header is tolerated.
+const hasPdfHeader = async (file: File): Promise<boolean> =>
+  (await readLatin1(file.slice(0, PDF_HEADER_SCAN_BYTES))).includes("%PDF-");
+
+// Only document-level metadata is read: XMP DOI/identifier fields and the Info /doi and
+// /Subject strings. Link annotations (/URI) point at cited papers, so they are skipped.
+// Field values are plain text once extracted (Info strings after unescaping \( \) \\),
+// so the page-text DOI_REGEX applies and keeps parentheses such as "(20)30183-5".
+const findMetadataDois = (raw: string): string[] => {
+  const found = new Map<string, string>();
+  const addDois = (value: string) => {
+    for (const doi of value.match(DOI_REGEX) ?? []) {
+      if (!found.has(doi.toLowerCase())) found.set(doi.toLowerCase(), doi);
+    }
+  };
+
+  for (const field of raw.matchAll(XMP_DOI_FIELD_REGEX)) addDois(field[2] ?? field[3] ?? "");
+  for (const field of raw.matchAll(INFO_DOI_FIELD_REGEX)) addDois(field[1].replace(PDF_STRING_ESCAPE_REGEX, "$1"));
+  return [...found.values()];
+};
+
+const lastMatch = (text: string, pattern: RegExp): RegExpMatchArray | undefined =>
+  [...text.matchAll(pattern)].pop();
+
+// Follows startxref -> trailer /Info -> xref entry to read only the Info dictionary.
+// Cross-reference streams are compressed (and usually keep Info in an object stream), so
+// those files, like tables split into several subsections, are left to pdf.js.
+async function findInfoDois(file: File): Promise<string[]> {
+  const tail = await readLatin1(file.slice(-PDF_TRAILER_SCAN_BYTES));
+  const startxref = lastMatch(tail, STARTXREF_REGEX);
+  const info = lastMatch(tail, TRAILER_INFO_REGEX);
+  if (!startxref || !info) return [];
+
+  const xrefOffset = Number(startxref[1]);
+  const section = (await readLatin1(file.slice(xrefOffset, xrefOffset + 64))).match(XREF_SECTION_HEADER_REGEX);
+  if (!section) return [];
+
+  const objectNumber = Number(info[1]);
+  const firstObject = Number(section[1]);
+  if (objectNumber < firstObject || objectNumber >= firstObject + Number(section[2])) return [];
+
+  const entryOffset = xrefOffset + section[0].length + (objectNumber - firstObject) * XREF_ENTRY_BYTES;
+  const entry = (await readLatin1(file.slice(entryOffset, entryOffset + XREF_ENTRY_BYTES))).match(XREF_ENTRY_REGEX);
+  if (!entry) return [];
+
+  const objectOffset = Number(entry[1]);
+  const object = await readLatin1(file.slice(objectOffset, objectOffset + PDF_OBJECT_SCAN_BYTES));
+  if (!object.startsWith(`${objectNumber} `)) return [];
+
+  const end = object.indexOf("endobj");
+  return findMetadataDois(end >= 0 ? object.slice(0, end) : object);
+}
+
+// A DOI cut off mid-parenthesis (e.g. one ending in ")") is not trusted over page text.
+const hasBalancedParentheses = (value: string): boolean => {
+  let depth = 0;
+  for (const char of value) {
+    if (char === "(") depth += 1;
+    else if (char === ")" && --depth < 0) return false;
+  }
+  return depth === 0;
+};
+
+const isUnambiguous = (dois: string[]): boolean => dois.length === 1 && hasBalancedParentheses(dois[0]);
+
+async function findDoisInPdf(file: File): Promise<string[]> {
+  // Most publisher PDFs carry the DOI as plain ASCII in the XMP/Info metadata near the
+  // start of the file, which is far cheaper to find than running pdf.js over the pages.
+  // Anything but a single unambiguous DOI falls through to page text.
+  const metadataDois = findMetadataDois(await readLatin1(file.slice(0, RAW_DOI_SCAN_BYTES)));
+  if (isUnambiguous(metadataDois)) return metadataDois;
+
+  // Large files can keep the Info dictionary past the scanned head; look it up via the xref.
+  if (metadataDois.length === 0 && file.size > RAW_DOI_SCAN_BYTES) {
+    const infoDois = await findInfoDois(file);
+    if (isUnambiguous(infoDois)) return infoDois;
+  }
+
   const data = await file.arrayBuffer();
   const pdf = await pdfjsLib.getDocument({ data }).promise;
-  const chunks: string[] = [];
 
-  for (let pageNo = 1; pageNo <= pdf.numPages; pageNo += 1) {
-    const page = await pdf.getPage(pageNo);
-    const textContent = await page.getTextContent();
-    const pageText = textContent.items.map((item) => ("str" in item ? item.str : "")).join(" ");
-    chunks.push(pageText);
+  try {
+    // The DOI is printed on the first page(s); later pages are references that only add noise.
+    // Stop at the first page that yields a DOI so page 2 is only parsed when page 1 has none.
+    const lastPage = Math.min(pdf.numPages, MAX_TEXT_PAGES);
+    for (let pageNo = 1; pageNo <= lastPage; pageNo += 1) {
+      const page = await pdf.getPage(pageNo);
+      const textContent = await page.getTextContent();
+      const pageText = textContent.items.map((item) => ("str" in item ? item.str : "")).join(" ");
+      const dois = findDois(pageText);
+      if (dois.length > 0) return dois;
+    }
+  } finally {
+    await pdf.destroy();
   }
 
-  return chunks.join("\n");
+  return [];
 }
 
-const findDois = (text: string): string[] => {
-  const matches = text.match(DOI_REGEX) ?? [];
-  return [...new Set(matches.map(cleanDoi).filter(Boolean))];
-};
-
 const getYear = (work: CrossrefWork): string => {
   const firstDate = work.issued?.["date-parts"]?.[0]?.[0];
   return firstDate ? String(firstDate) : "UnknownYear";
@@ -168,7 +307,7 @@ const getJournalAbbr = (work: CrossrefWork): string => {
   if (!journal) return "UnknownJournal";
 
   const abbr = journal
-    .split(/\s+/)
+    .split(WHITESPACE_REGEX)
     .map((word) => word.trim())
     .filter((word) => word.length > 0)
     .filter((word) => !JOURNAL_STOP_WORDS.has(word.toLowerCase()))
@@ -178,16 +317,158 @@ const getJournalAbbr = (work: CrossrefWork): string => {
   return truncate(abbr || "UnknownJournal", MAX_JOURNAL_ABBR_LENGTH);
 };
 
-async function fetchCrossref(doi: string): Promise<CrossrefWork> {
-  const response = await fetch(`https://api.crossref.org/works/${encodeURIComponent(doi)}`);
-  if (!response.ok) throw new Error(`Crossref request failed (${response.status})`);
+const sleep = (ms: number, signal?: AbortSignal): Promise<void> =>
+  new Promise((resolve, reject) => {
+    signal?.throwIfAborted();
+    const timer = setTimeout(resolve, ms);
+    signal?.addEventListener(
+      "abort",
+      () => {
+        clearTimeout(timer);
+        reject(signal.reason);
+      },
+      { once: true },
+    );
+  });
+
+// Retry-After is either delta-seconds or an HTTP date; absent or unreadable
+// (e.g. not exposed via CORS) falls back to exponential backoff. The delay is not
+// capped here: callers give up instead of retrying before the server allows it.
+const getRetryDelay = (response: Response, fallbackMs: number): number => {
+  const header = response.headers.get("Retry-After");
+  if (!header) return fallbackMs;
+
+  const seconds = Number(header);
+  const delayMs = Number.isFinite(seconds) ? seconds * 1000 : Date.parse(header) - Date.now();
+  if (Number.isNaN(delayMs)) return fallbackMs;
+  return Math.max(delayMs, 0);
+};
+
+async function fetchWithRetry(url: string, signal?: AbortSignal): Promise<Response> {
+  let backoffMs = RETRY_BASE_DELAY_MS;
+  for (let attempt = 1; ; attempt += 1) {
+    const response = await fetch(url, { signal });
+    if (!RETRYABLE_STATUSES.has(response.status) || attempt >= MAX_FETCH_ATTEMPTS) return response;
+
+    const delayMs = getRetryDelay(response, backoffMs);
+    if (delayMs > MAX_RETRY_DELAY_MS) return response;
+
+    void response.body?.cancel();
+    await sleep(delayMs, signal);
+    backoffMs *= 2;
+  }
+}
+
+// Thrown when a source answers definitively that it has no record for the DOI.
+class MetadataNotFoundError extends Error {}
+
+const toLookupError = (source: string, status: number): Error =>
+  status === 404
+    ? new MetadataNotFoundError(`${source} request failed (${status})`)
+    : new Error(`${source} request failed (${status})`);
+
+async function fetchCrossref(doi: string, signal?: AbortSignal): Promise<CrossrefWork> {
+  const response = await fetchWithRetry(`https://api.crossref.org/works/${encodeURIComponent(doi)}`, signal);
+  if (!response.ok) throw toLookupError("Crossref", response.status);
 
   const payload = (await response.json()) as { message?: CrossrefWork };
-  if (!payload.message) throw new Error("Crossref response missing metadata");
+  if (!payload.message) throw new MetadataNotFoundError("Crossref response missing metadata");
 
   return payload.message;
 }
 
+const toCrossrefWork = (work: OpenAlexWork, doi: string): CrossrefWork => {
+  const authorName = work.authorships?.[0]?.author?.display_name?.trim();
+  const journal = work.primary_location?.source?.display_name;
+  return {
+    title: work.title ? [work.title] : undefined,
+    author: authorName ? [{ family: authorName.split(WHITESPACE_REGEX).pop(), name: authorName }] : undefined,
+    issued: work.publication_year ? { "date-parts": [[work.publication_year]] } : undefined,
+    "container-title": journal ? [journal] : undefined,
+    DOI: doi,
+  };
+};
+
+async function fetchOpenAlex(doi: string, signal?: AbortSignal): Promise<CrossrefWork> {
+  const path = doi.split("/").map(encodeURIComponent).join("/");
+  const response = await fetchWithRetry(`https://api.openalex.org/works/https://doi.org/${path}`, signal);
+  if (!response.ok) throw toLookupError("OpenAlex", response.status);
+
+  const payload = (await response.json()) as OpenAlexWork;
+  if (!payload.title) throw new MetadataNotFoundError("OpenAlex response missing metadata");
+
+  return toCrossrefWork(payload, doi);
+}
+
+// Crossref is preferred, but OpenAlex is fired at the same time so a Crossref
+// failure falls back without paying for a second round-trip.
+async function fetchMetadata(doi: string): Promise<CrossrefWork> {
+  const openAlexController = new AbortController();
+  const openAlex = fetchOpenAlex(doi, openAlexController.signal);
+  openAlex.catch(() => undefined);
+
+  try {
+    const work = await fetchCrossref(doi);
+    openAlexController.abort();
+    return work;
+  } catch (crossrefError) {
+    try {
+      return await openAlex;
+    } catch (openAlexError) {
+      // Report a definitive miss only when both sources agree; otherwise surface the transient failure.
+      const crossrefMissed = crossrefError instanceof MetadataNotFoundError;
+      throw crossrefMissed && !(openAlexError instanceof MetadataNotFoundError) ? openAlexError : crossrefError;
+    }
+  }
+}
+
+const metadataCache = new Map<string, MetadataCacheEntry>();
+const metadataMissCache = new Map<string, MetadataMissEntry>();
+
+// Map order doubles as LRU order: re-inserting moves a key to the end.
+function setBounded<T>(cache: Map<string, T>, key: string, value: T, maxSize: number) {
+  cache.delete(key);
+  cache.set(key, value);
+  if (cache.size > maxSize) {
+    const oldest = cache.keys().next().value;
+    if (oldest !== undefined) cache.delete(oldest);
+  }
+}
+
+// Pending lookups are cached as well, so jobs sharing a DOI wait on one request
+// instead of each hitting Crossref/OpenAlex. DOIs neither source knows are remembered
+// for a minute; transient failures are not cached, and an explicit retry skips the
+// miss cache altogether.
+async function fetchMetadataCached(doi: string, bypassMiss = false): Promise<CrossrefWork> {
+  const key = doi.toLowerCase();
+  const now = Date.now();
+  const cached = metadataCache.get(key);
+  if (cached && cached.expiresAt > now) {
+    setBounded(metadataCache, key, cached, METADATA_CACHE_SIZE);
+    return cached.work;
+  }
+
+  const miss = metadataMissCache.get(key);
+  if (!bypassMiss && miss && miss.expiresAt > now) throw miss.error;
+  metadataMissCache.delete(key);
+
+  const work = fetchMetadata(doi);
+  setBounded(metadataCache, key, { work, expiresAt: now + METADATA_CACHE_TTL_MS }, METADATA_CACHE_SIZE);
+
+  work.catch((error: unknown) => {
+    if (metadataCache.get(key)?.work !== work) return;
+    metadataCache.delete(key);
+    if (!(error instanceof MetadataNotFoundError)) return;
+    setBounded(
+      metadataMissCache,
+      key,
+      { error, expiresAt: Date.now() + METADATA_MISS_CACHE_TTL_MS },
+      METADATA_MISS_CACHE_SIZE,
+    );
+  });
+  return work;
+}
+
 export default function Home() {
   const [lang, setLang] = useState<Lang>("en");
   const [jobs, setJobs] = useState<PdfJob[]>([]);
@@ -199,7 +480,7 @@ export default function Home() {
     jobsRef.current = jobs;
   }, [jobs]);
 
-  const lookupDoi = async (doi: string) => fetchCrossref(doi);
+  const lookupDoi = async (doi: string, bypassMiss = false) => fetchMetadataCached(doi, bypassMiss);
 
   const getFallbackName = (fileName: string): string => {
     const base = fileName.toLowerCase().endsWith(".pdf") ? fileName.slice(0, -4) : fileName;
@@ -251,7 +532,7 @@ export default function Home() {
   const getJobLatest = (jobId: string): PdfJob | undefined =>
     jobsRef.current.find((job) => job.id === jobId);
 
-  const processJob = async (jobId: string) => {
+  const processJob = async (jobId: string, isRetry = false) => {
     const start = getJobLatest(jobId);
     if (!start) return;
 
@@ -266,13 +547,17 @@ export default function Home() {
     );
 
     try {
-      const text = await extractTextFromPdf(file);
-
-      updateJobs((prev) =>
-        prev.map((job) => (job.id === jobId ? { ...job, status: "detecting" } : job)),
-      );
+      if (!(await hasPdfHeader(file))) {
+        updateJobs((prev) =>
+          prev.map((job) =>
+            job.id === jobId ? { ...job, status: "failed", error: t.invalidPdf, metadata: undefined } : job,
+          ),
+        );
+        return;
+      }
 
-      const detected = findDois(text);
+      // DOI detection runs page by page inside the extraction, so "extracting" covers both.
+      const detected = await findDoisInPdf(file);
 
       const selectedCandidate =
         selectedTrim.length > 0 ? selectedTrim : (detected[0] ?? "");
@@ -320,7 +605,7 @@ export default function Home() {
       );
 
       try {
-        const work = await lookupDoi(doiToLookup);
+        const work = await lookupDoi(doiToLookup, isRetry);
         updateJobs((prev) =>
           prev.map((job) =>
             job.id === jobId
@@ -360,8 +645,8 @@ export default function Home() {
   };
 
   const downloadJob = async (job: PdfJob) => {
-    const buf = await job.file.arrayBuffer();
-    const blob = new Blob([buf], { type: "application/pdf" });
+    // Wrapping the File keeps the Blob backed by the original upload instead of a copy in memory.
+    const blob = new Blob([job.file], { type: "application/pdf" });
     const url = URL.createObjectURL(blob);
 
     const anchor = document.createElement("a");
@@ -421,8 +706,6 @@ export default function Home() {
         return t.statusQueued;
       case "extracting":
         return t.statusExtracting;
-      case "detecting":
-        return t.statusDetecting;
       case "fetching":
         return t.statusFetching;
       case "ready":
@@ -486,32 +769,22 @@ export default function Home() {
           <table style={{ width: "100%", borderCollapse: "collapse", fontSize: 14 }}>
             <thead>
               <tr>
-                <th style={{ textAlign: "left", borderBottom: "1px solid #e5e7eb", padding: "8px 6px" }}>
-                  {t.fileName}
-                </th>
-                <th style={{ textAlign: "left", borderBottom: "1px solid #e5e7eb", padding: "8px 6px" }}>
-                  {t.status}
-                </th>
-                <th style={{ textAlign: "left", borderBottom: "1px solid #e5e7eb", padding: "8px 6px" }}>
-                  {t.doi}
-                </th>
-                <th style={{ textAlign: "left", borderBottom: "1px solid #e5e7eb", padding: "8px 6px" }}>
-                  {t.resolvedFilename}
-                </th>
-                <th style={{ textAlign: "left", borderBottom: "1px solid #e5e7eb", padding: "8px 6px" }}>
-                  {t.actions}
-                </th>
+                <th style={TABLE_HEADER_STYLE}>{t.fileName}</th>
+                <th style={TABLE_HEADER_STYLE}>{t.status}</th>
+                <th style={TABLE_HEADER_STYLE}>{t.doi}</th>
+                <th style={TABLE_HEADER_STYLE}>{t.resolvedFilename}</th>
+                <th style={TABLE_HEADER_STYLE}>{t.actions}</th>
               </tr>
             </thead>
             <tbody>
               {jobs.map((job) => (
                 <tr key={job.id}>
-                  <td style={{ verticalAlign: "top", padding: "8px 6px" }}>{job.file.name}</td>
-                  <td style={{ verticalAlign: "top", padding: "8px 6px" }}>
+                  <td style={TABLE_CELL_STYLE}>{job.file.name}</td>
+                  <td style={TABLE_CELL_STYLE}>
                     {statusLabel(job.status)}
                     {job.error ? <div style={{ color: "#b42318" }}>{job.error}</div> : null}
                   </td>
-                  <td style={{ verticalAlign: "top", padding: "8px 6px", minWidth: 220 }}>
+                  <td style={DOI_CELL_STYLE}>
                     {job.dois.length > 0 ? (
                       <select
                         value={job.selectedDoi ?? job.dois[0]}
@@ -543,13 +816,13 @@ export default function Home() {
                       }
                     />
                   </td>
-                  <td style={{ verticalAlign: "top", padding: "8px 6px" }}>{job.resolvedFilename}</td>
-                  <td style={{ verticalAlign: "top", padding: "8px 6px" }}>
+                  <td style={TABLE_CELL_STYLE}>{job.resolvedFilename}</td>
+                  <td style={TABLE_CELL_STYLE}>
                     <div style={{ display: "flex", flexWrap: "wrap", gap: 6 }}>
                       <button type="button" onClick={() => void processJob(job.id)} disabled={job.status !== "queued"}>
                         {t.process}
                       </button>
-                      <button type="button" onClick={() => void processJob(job.id)} disabled={job.status !== "failed"}>
+                      <button type="button" onClick={() => void processJob(job.id, true)} disabled={job.status !== "failed"}>
                         {t.retry}
                       </button>
                       <button